@@ -14,11 +14,18 @@ Usage:
 """
 
 import argparse
+import bisect
+import hashlib
+import mmap
+import os
+import pickle
 import re
 import sys
 from pathlib import Path
 from collections import defaultdict
-from typing import NamedTuple
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from typing import NamedTuple, TextIO
 
 
 class MemberInfo(NamedTuple):
@@ -36,6 +43,17 @@ class TypeInfo(NamedTuple):
     is_partial: bool
 
 
+class BraceIndex(NamedTuple):
+    positions: list[int]  # offset of every brace, in order
+    ends: list[int]  # per brace, offset of the '}' returning to the depth before it, or -1
+
+
+class Patterns(NamedTuple):
+    top_level: re.Pattern
+    brace: re.Pattern
+    member: re.Pattern
+
+
 class FileInfo(NamedTuple):
     path: str
     namespace: str
@@ -48,6 +66,11 @@ DEFAULT_EXCLUDES = {
     'TestResults', '.vs', 'Debug', 'Release'
 }
 
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'codebase-mapper'
+
+# Names, namespaces and usings repeat across thousands of files; share one copy
+_intern = sys.intern
+
 FRAMEWORK_INDICATORS = {
     'Microsoft.AspNetCore': 'ASP.NET Core',
     'Microsoft.EntityFrameworkCore': 'EF Core',
@@ -64,59 +87,115 @@ FRAMEWORK_INDICATORS = {
 }
 
 # Regex patterns
-NAMESPACE_PATTERN = re.compile(
-    r'^\s*namespace\s+([\w.]+)\s*[;{]',
-    re.MULTILINE
-)
-
-USING_PATTERN = re.compile(
-    r'^\s*using\s+(?:static\s+)?([\w.]+)\s*;',
-    re.MULTILINE
-)
-
-TYPE_PATTERN = re.compile(
+# Namespaces, usings and type declarations are found in a single pass over the
+# file; m.lastgroup names the alternative that matched. Matches can't overlap,
+# so base lists stop at a ';' or a namespace line outside comments: a stray
+# "class X:" in a comment must not run on to the next '{' and swallow the
+# usings or namespace. Comments can't give back characters, so a failing base
+# list doesn't backtrack.
+TOP_LEVEL_PATTERN = re.compile(
     r'''
-    (?P<attributes>(?:\[[\w\s,()="\.]+\]\s*)*)  # Attributes
-    (?P<modifiers>(?:public|private|protected|internal|static|abstract|sealed|partial)\s+)*
-    (?P<kind>class|interface|enum|record|struct)\s+
-    (?P<name>\w+)
-    (?:<[^>]+>)?  # Generic parameters
-    (?:\s*:\s*(?P<bases>[^{]+))?  # Base types
-    \s*\{
+    ^\s*namespace\s+(?P<namespace>[\w.]+)\s*[;{]
+    |
+    ^\s*using\s+(?:static\s+)?(?P<using>[\w.]+)\s*;
+    |
+    (?P<type>
+        (?P<attributes>(?:\[[\w\s,()="\.]+\]\s*)*)  # Attributes
+        (?P<modifiers>(?:public|private|protected|internal|static|abstract|sealed|partial)\s+)*
+        (?P<kind>class|interface|enum|record|struct)\s+
+        (?P<name>\w+)
+        (?:<[^>]+>)?  # Generic parameters
+        (?:\s*:\s*(?P<bases>(?:  # Base types
+            (?!^\s*namespace\b)
+            (?: //[^{\n]*(?![^{\n])  # Line comment
+              | /\*(?:[^*{]|\*(?!/))*(?:\*/|(?=\{))  # Block comment
+              | /(?![/*])
+              | [^{;/]
+            )
+        )+))?
+        \s*\{
+    )
     ''',
     re.VERBOSE | re.MULTILINE
 )
 
-METHOD_PATTERN = re.compile(
+# Braces outside comments and string/char literals
+BRACE_PATTERN = re.compile(
     r'''
-    (?P<attributes>(?:\[[\w\s,()="\.]+\]\s*)*)  # Attributes
-    (?P<modifiers>(?:public|private|protected|internal|static|virtual|override|abstract|async)\s+)*
-    (?P<return>[\w<>\[\],\s\?]+)\s+
-    (?P<name>\w+)\s*
-    (?:<[^>]+>)?  # Generic parameters
-    \((?P<params>[^)]*)\)  # Parameters
+    //[^\n]*  # Line comment
+    | /\*.*?\*/  # Block comment
+    | (?:@\$?|\$@)"(?:[^"]|"")*"  # Verbatim string
+    | "(?:\\.|[^"\\\n])*"  # String
+    | '(?:\\.|[^'\\\n])+'  # Char literal
+    | (?P<open>\{) | (?P<close>\})
     ''',
-    re.VERBOSE
+    re.VERBOSE | re.DOTALL
 )
 
-PROPERTY_PATTERN = re.compile(
+# Methods and properties are matched by one alternation so each type body is
+# scanned once; each branch keeps its own modifier list. A match can only start
+# where a run of type-name characters starts or at an attribute, which is the
+# leftmost position finditer would report anyway; trying every position inside a
+# long run of words and whitespace made the scan quadratic.
+MEMBER_PATTERN = re.compile(
     r'''
-    (?P<attributes>(?:\[[\w\s,()="\.]+\]\s*)*)  # Attributes
-    (?P<modifiers>(?:public|private|protected|internal|static|virtual|override|abstract)\s+)*
-    (?P<type>[\w<>\[\],\s\?]+)\s+
-    (?P<name>\w+)\s*
-    \{\s*(?:get|set|init)
+    (?:(?<![\w<>\[\],\s\?])|(?=\[[\w\s,()="\.]+\]))
+    (?:
+        (?P<method>
+            (?:\[[\w\s,()="\.]+\]\s*)*  # Attributes
+            (?P<method_modifiers>(?:public|private|protected|internal|static|virtual|override|abstract|async)\s+)*
+            (?P<return>[\w<>\[\],\s\?]+)\s+
+            (?P<method_name>\w+)\s*
+            (?:<[^>]+>)?  # Generic parameters
+            \((?P<params>[^)]*)\)  # Parameters
+        )
+        |
+        (?P<property>
+            (?:\[[\w\s,()="\.]+\]\s*)*  # Attributes
+            (?P<property_modifiers>(?:public|private|protected|internal|static|virtual|override|abstract)\s+)*
+            (?P<type>[\w<>\[\],\s\?]+)\s+
+            (?P<property_name>\w+)\s*
+            \{\s*(?:get|set|init)
+        )
+    )
     ''',
     re.VERBOSE
 )
 
+TEXT_PATTERNS = Patterns(TOP_LEVEL_PATTERN, BRACE_PATTERN, MEMBER_PATTERN)
+
+# Large files are memory-mapped and scanned as bytes when they are plain ASCII
+# with no lone '\r' (read_text would turn it into a newline); \w and \s then
+# match the same characters as in the text patterns
+MMAP_THRESHOLD = 64 * 1024
+BYTES_PATTERNS = Patterns(*(
+    re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
+    for pattern in TEXT_PATTERNS
+))
+NEEDS_TEXT_PATTERN = re.compile(rb'[^\x00-\x7f]|\r(?!\n)')
+
 
-def should_exclude(path: Path, excludes: set[str]) -> bool:
-    """Check if path should be excluded."""
-    for part in path.parts:
-        if part in excludes or part.startswith('.'):
-            return True
-    return False
+def should_exclude(name: str, excludes: frozenset[str]) -> bool:
+    """Check if a directory or file name should be excluded."""
+    return name in excludes or name[:1] == '.'
+
+
+def find_cs_files(directory: str, excludes: frozenset[str]) -> Iterator[Path]:
+    """Recursively find C# files, without descending into excluded directories."""
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if should_exclude(entry.name, excludes):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.cs'):
+                    yield Path(entry.path)
+    except (PermissionError, NotADirectoryError):
+        return
+    for subdir in subdirs:
+        yield from find_cs_files(subdir, excludes)
 
 
 def extract_attributes(attr_str: str) -> list[str]:
@@ -127,31 +206,59 @@ def extract_attributes(attr_str: str) -> list[str]:
     return attrs
 
 
-def find_type_end(content: str, start: int) -> int:
-    """Find the end of a type definition by matching braces."""
+def group_text(match: re.Match, name: str) -> str | None:
+    """Get a match group as text, decoding groups matched on bytes."""
+    value = match.group(name)
+    if isinstance(value, bytes):
+        return value.decode('ascii')
+    return value
+
+
+def index_braces(content: str | bytes, patterns: Patterns) -> BraceIndex:
+    """Index the braces of a file once so type ends can be looked up per type."""
+    positions = []
+    depths = []
     depth = 0
-    i = start
-    while i < len(content):
-        if content[i] == '{':
-            depth += 1
-        elif content[i] == '}':
-            depth -= 1
-            if depth == 0:
-                return i
-        i += 1
-    return len(content)
-
-
-def parse_type(match: re.Match, content: str, depth: str) -> TypeInfo:
-    """Parse a type definition from regex match."""
-    modifiers = match.group('modifiers') or ''
+    for m in patterns.brace.finditer(content):
+        brace = m.lastgroup
+        if not brace:
+            continue
+        depth += 1 if brace == 'open' else -1
+        positions.append(m.start())
+        depths.append(depth)
+
+    # Walking backwards, remember the nearest '}' returning to each depth so every
+    # brace is paired with its end in one pass
+    ends = [-1] * len(positions)
+    next_close: dict[int, int] = {}
+    for i in range(len(positions) - 1, -1, -1):
+        before = depths[i - 1] if i else 0
+        if depths[i] < before:
+            next_close[depths[i]] = positions[i]
+        ends[i] = next_close.get(before, -1)
+    return BraceIndex(positions, ends)
+
+
+def find_type_end(braces: BraceIndex, start: int, default: int) -> int:
+    """Find the end of a type definition by matching braces."""
+    # The type ends at the first '}' that brings depth back to where it was
+    first = bisect.bisect_left(braces.positions, start)
+    if first == len(braces.positions) or braces.ends[first] < 0:
+        return default
+    return braces.ends[first]
+
+
+def _parse_type_classes(match: re.Match, content: str | bytes, braces: BraceIndex | None,
+                        patterns: Patterns) -> TypeInfo:
+    """Parse a type definition from regex match, without its members."""
+    modifiers = group_text(match, 'modifiers') or ''
     is_partial = 'partial' in modifiers
 
-    kind = match.group('kind')
-    name = match.group('name')
+    kind = _intern(group_text(match, 'kind'))
+    name = _intern(group_text(match, 'name'))
 
     bases = []
-    bases_str = match.group('bases')
+    bases_str = group_text(match, 'bases')
     if bases_str:
         # Split on comma, clean up whitespace and where clauses
         bases_str = re.sub(r'\bwhere\b.*', '', bases_str)
@@ -160,62 +267,96 @@ def parse_type(match: re.Match, content: str, depth: str) -> TypeInfo:
             if base:
                 # Remove generic parameters for brevity
                 base = re.sub(r'<[^>]+>', '', base)
-                bases.append(base)
+                bases.append(_intern(base))
 
-    attributes = extract_attributes(match.group('attributes'))
+    attributes = [_intern(a) for a in extract_attributes(group_text(match, 'attributes'))]
 
-    members = []
-    if depth != 'classes' and kind != 'enum':
-        # Find the body of this type
-        type_start = match.end()
-        type_end = find_type_end(content, match.start())
-        type_body = content[type_start:type_end]
-
-        # Find methods
-        for m in METHOD_PATTERN.finditer(type_body):
-            method_name = m.group('name')
-            method_modifiers = m.group('modifiers') or ''
+    return TypeInfo(
+        name=name,
+        kind=kind,
+        bases=bases,
+        members=[],
+        attributes=attributes,
+        is_partial=is_partial
+    )
 
-            # Skip private/protected unless full depth
-            if depth != 'full':
-                if 'private' in method_modifiers or 'protected' in method_modifiers:
-                    continue
 
-            # Skip constructors, getters/setters
-            if method_name in [name, 'get', 'set', 'add', 'remove']:
-                continue
+def _parse_members(match: re.Match, content: str | bytes, braces: BraceIndex, patterns: Patterns,
+                   type_name: str, public_only: bool) -> list[MemberInfo]:
+    """Find the methods and properties of a type; methods are listed first."""
+    # Find the body of this type; it is searched in place rather than sliced
+    type_start = match.end()
+    type_end = find_type_end(braces, match.start(), len(content))
 
-            is_async = 'async' in method_modifiers
-            members.append(MemberInfo(
-                name=f"{method_name}()",
-                kind='method',
-                is_async=is_async
-            ))
+    methods = []
+    properties = []
+    for m in patterns.member.finditer(content, type_start, type_end):
+        member_kind = m.lastgroup
+        member_name = group_text(m, f'{member_kind}_name')
+        member_modifiers = group_text(m, f'{member_kind}_modifiers') or ''
 
-        # Find properties
-        for p in PROPERTY_PATTERN.finditer(type_body):
-            prop_modifiers = p.group('modifiers') or ''
-            if depth != 'full':
-                if 'private' in prop_modifiers or 'protected' in prop_modifiers:
-                    continue
+        # Skip private/protected unless full depth
+        if public_only and ('private' in member_modifiers or 'protected' in member_modifiers):
+            continue
 
-            members.append(MemberInfo(
-                name=p.group('name'),
+        if member_kind == 'property':
+            properties.append(MemberInfo(
+                name=member_name,
                 kind='property'
             ))
+            continue
 
-    return TypeInfo(
-        name=name,
-        kind=kind,
-        bases=bases,
-        members=members,
-        attributes=attributes,
-        is_partial=is_partial
+        # Skip constructors, getters/setters
+        if member_name in [type_name, 'get', 'set', 'add', 'remove']:
+            continue
+
+        is_async = 'async' in member_modifiers
+        methods.append(MemberInfo(
+            name=f"{member_name}()",
+            kind='method',
+            is_async=is_async
+        ))
+
+    return methods + properties
+
+
+def _parse_type_methods(match: re.Match, content: str | bytes, braces: BraceIndex | None,
+                        patterns: Patterns) -> TypeInfo:
+    """Parse a type definition from regex match, with its public members."""
+    type_info = _parse_type_classes(match, content, braces, patterns)
+    if type_info.kind == 'enum':
+        return type_info
+    return type_info._replace(
+        members=_parse_members(match, content, braces, patterns, type_info.name, public_only=True)
     )
 
 
+def _parse_type_full(match: re.Match, content: str | bytes, braces: BraceIndex | None,
+                     patterns: Patterns) -> TypeInfo:
+    """Parse a type definition from regex match, with all of its members."""
+    type_info = _parse_type_classes(match, content, braces, patterns)
+    if type_info.kind == 'enum':
+        return type_info
+    return type_info._replace(
+        members=_parse_members(match, content, braces, patterns, type_info.name, public_only=False)
+    )
+
+
+# Type parser per --depth, so the member loop never re-checks the depth
+PARSE_TYPE = {
+    'classes': _parse_type_classes,
+    'methods': _parse_type_methods,
+    'full': _parse_type_full,
+}
+
+
 def parse_file(filepath: Path, depth: str) -> FileInfo | None:
     """Parse a C# file and extract structure."""
+    if filepath.stat().st_size > MMAP_THRESHOLD:
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            if not NEEDS_TEXT_PATTERN.search(content):
+                return parse_content(filepath, content, BYTES_PATTERNS, depth)
+
     try:
         content = filepath.read_text(encoding='utf-8-sig')  # Handle BOM
     except UnicodeDecodeError:
@@ -224,19 +365,26 @@ def parse_file(filepath: Path, depth: str) -> FileInfo | None:
         except Exception:
             print(f"Warning: Skipping unreadable file: {filepath}", file=sys.stderr)
             return None
+    return parse_content(filepath, content, TEXT_PATTERNS, depth)
 
-    # Extract namespace
-    ns_match = NAMESPACE_PATTERN.search(content)
-    namespace = ns_match.group(1) if ns_match else ''
-
-    # Extract usings
-    usings = [m.group(1) for m in USING_PATTERN.finditer(content)]
 
-    # Extract types
+def parse_content(filepath: Path, content: str | mmap.mmap, patterns: Patterns, depth: str) -> FileInfo:
+    """Extract structure from the text, or memory-mapped ASCII bytes, of a C# file."""
+    # Extract namespace, usings and types in one pass, indexing braces once
+    # for all type bodies in the file
+    parse_type = PARSE_TYPE[depth]
+    braces = index_braces(content, patterns) if depth != 'classes' else None
+    namespace = ''
+    usings = []
     types = []
-    for match in TYPE_PATTERN.finditer(content):
-        type_info = parse_type(match, content, depth)
-        types.append(type_info)
+    for match in patterns.top_level.finditer(content):
+        kind = match.lastgroup
+        if kind == 'type':
+            types.append(parse_type(match, content, braces, patterns))
+        elif kind == 'using':
+            usings.append(_intern(group_text(match, 'using')))
+        elif not namespace:
+            namespace = _intern(group_text(match, 'namespace'))
 
     return FileInfo(
         path=str(filepath),
@@ -246,28 +394,104 @@ def parse_file(filepath: Path, depth: str) -> FileInfo | None:
     )
 
 
+def parse_files(parse: Callable[[Path], FileInfo | None], paths: list[Path],
+                jobs: int) -> Iterator[FileInfo | None]:
+    """Parse files across worker processes, yielding results in input order."""
+    # A single chunk would go to one worker anyway, so small batches (e.g. a
+    # warm cache) skip starting the pool and importing its machinery
+    chunksize = 32
+    if jobs <= 1 or len(paths) <= chunksize:
+        yield from map(parse, paths)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(parse, paths, chunksize=chunksize)
+
+
+def cache_file_for(root: Path, depth: str) -> Path:
+    """Location of the parse cache for a source root and depth."""
+    digest = hashlib.sha1(str(root).encode('utf-8')).hexdigest()[:16]
+    return CACHE_DIR / f'cs-{digest}-{depth}.pkl'
+
+
+def parser_version() -> str:
+    """Digest of this script, so cached results never outlive a parser change."""
+    return hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+
+def cache_key(path: Path) -> tuple[str, int, int]:
+    """Key a file by path, modification time and size."""
+    st = path.stat()
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def load_cache(cache_file: Path) -> dict[tuple[str, int, int], FileInfo]:
+    """Load cached parse results, treating a missing or stale cache as empty."""
+    try:
+        with cache_file.open('rb') as f:
+            version, entries = pickle.load(f)
+    except Exception:
+        return {}
+    return entries if version == parser_version() else {}
+
+
+def save_cache(cache_file: Path, entries: dict[tuple[str, int, int], FileInfo]) -> None:
+    """Write parse results for the next run; failures only cost a re-parse."""
+    tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_file.open('wb') as f:
+            pickle.dump((parser_version(), entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write cache {cache_file}: {e}", file=sys.stderr)
+
+
+def build_prefix_trie(prefixes: Iterable[str]) -> dict:
+    """Build a character trie; the None key of a node holds the prefix ending there."""
+    trie: dict = {}
+    for prefix in prefixes:
+        node = trie
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node[None] = prefix
+    return trie
+
+
+FW_TRIE = build_prefix_trie(FRAMEWORK_INDICATORS)
+
+
 def detect_frameworks(all_usings: set[str]) -> list[str]:
     """Detect frameworks from using statements."""
+    # Walk each using once through the trie, collecting every indicator prefix
+    matched = set()
+    for u in all_usings:
+        node = FW_TRIE
+        for ch in u:
+            node = node.get(ch)
+            if node is None:
+                break
+            if None in node:
+                matched.add(node[None])
+
     detected = []
     for using, name in FRAMEWORK_INDICATORS.items():
-        for u in all_usings:
-            if u.startswith(using):
-                if name not in detected:
-                    detected.append(name)
-                break
+        if using in matched and name not in detected:
+            detected.append(name)
     return detected
 
 
 def format_type(t: TypeInfo) -> str:
     """Format a type for output."""
-    parts = [f"`{t.name}"]
+    head = [f"`{t.name}"]
 
     if t.bases:
-        parts[0] += f" : {', '.join(t.bases[:3])}"
+        head.append(f" : {', '.join(t.bases[:3])}")
         if len(t.bases) > 3:
-            parts[0] += f' (+{len(t.bases) - 3})'
+            head.append(f' (+{len(t.bases) - 3})')
 
-    parts[0] += '`'
+    head.append('`')
+    parts = [''.join(head)]
 
     if t.kind != 'class':
         parts.append(f'[{t.kind}]')
@@ -289,14 +513,13 @@ def format_type(t: TypeInfo) -> str:
     return ' '.join(parts)
 
 
-def format_output(files: list[FileInfo], root: Path, frameworks: list[str]) -> str:
-    """Format the parsed files into markdown output."""
-    lines = []
-    lines.append("### C#: " + str(root.name) + "/")
+def iter_output_lines(files: list[FileInfo], root: Path, frameworks: list[str]) -> Iterator[str]:
+    """Yield the markdown output for the parsed files, line by line."""
+    yield "### C#: " + str(root.name) + "/"
 
     if frameworks:
-        lines.append(f"**Frameworks detected:** {', '.join(frameworks)}")
-        lines.append("")
+        yield f"**Frameworks detected:** {', '.join(frameworks)}"
+        yield ""
 
     # Group by namespace/project
     ns_files: dict[str, list[FileInfo]] = defaultdict(list)
@@ -306,7 +529,7 @@ def format_output(files: list[FileInfo], root: Path, frameworks: list[str]) -> s
 
     for ns in sorted(ns_files.keys()):
         ns_file_list = ns_files[ns]
-        lines.append(f"- `{ns}`")
+        yield f"- `{ns}`"
 
         for f in sorted(ns_file_list, key=lambda x: x.path):
             rel_path = Path(f.path).relative_to(root)
@@ -316,9 +539,20 @@ def format_output(files: list[FileInfo], root: Path, frameworks: list[str]) -> s
                 continue
 
             for t in f.types:
-                lines.append(f"  - `{filename}`: {format_type(t)}")
+                yield f"  - `{filename}`: {format_type(t)}"
 
-    return '\n'.join(lines)
+
+def format_output(files: list[FileInfo], root: Path, frameworks: list[str]) -> str:
+    """Format the parsed files into markdown output."""
+    return '\n'.join(iter_output_lines(files, root, frameworks))
+
+
+def write_output(out: TextIO, lines: Iterable[str]) -> None:
+    """Write output lines to a stream as they are produced, newline-separated."""
+    sep = ''
+    for line in lines:
+        out.write(sep + line)
+        sep = '\n'
 
 
 def main():
@@ -329,6 +563,10 @@ def main():
                         help='Output depth level')
     parser.add_argument('--exclude', type=str, default='',
                         help='Comma-separated directories to exclude')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Parallel parser processes (default: CPU count, 1 disables)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse every file instead of reusing results from the last run')
     args = parser.parse_args()
 
     root = args.root.resolve()
@@ -339,6 +577,7 @@ def main():
     excludes = DEFAULT_EXCLUDES.copy()
     if args.exclude:
         excludes.update(args.exclude.split(','))
+    excludes = frozenset(excludes)
 
     # Collect all C# files
     files: list[FileInfo] = []
@@ -347,13 +586,21 @@ def main():
     type_count = 0
     member_count = 0
 
-    for cs_file in root.rglob('*.cs'):
-        rel_path = cs_file.relative_to(root)
-        if should_exclude(rel_path, excludes):
-            continue
+    cs_files = list(find_cs_files(str(root), excludes))
 
-        file_info = parse_file(cs_file, args.depth)
+    # Only files changed since the last run are parsed
+    cache_file = None if args.no_cache else cache_file_for(root, args.depth)
+    cached = load_cache(cache_file) if cache_file else {}
+    keys = [cache_key(cs_file) for cs_file in cs_files]
+    stale = [cs_file for cs_file, key in zip(cs_files, keys) if key not in cached]
+    parse = partial(parse_file, depth=args.depth)
+    parsed = dict(zip(stale, parse_files(parse, stale, args.jobs)))
+
+    entries = {}
+    for cs_file, key in zip(cs_files, keys):
+        file_info = cached[key] if key in cached else parsed[cs_file]
         if file_info:
+            entries[key] = file_info
             files.append(file_info)
             all_usings.update(file_info.usings)
             file_count += 1
@@ -361,18 +608,24 @@ def main():
             for t in file_info.types:
                 member_count += len(t.members)
 
+    # A warm run leaves the cache untouched; deleted files drop out of entries
+    if cache_file and (any(parsed.values()) or len(entries) != len(cached)):
+        save_cache(cache_file, entries)
+
     frameworks = detect_frameworks(all_usings)
-    output = format_output(files, root, frameworks)
 
     # Add stats as comment
     stats = f"\n<!-- C#: {file_count} files, {type_count} types, {member_count} members -->\n"
 
     if args.output:
-        args.output.write_text(output + stats, encoding='utf-8')
+        # Stream to the file rather than building the whole map in memory first
+        with args.output.open('w', encoding='utf-8', buffering=1024 * 1024) as out:
+            write_output(out, iter_output_lines(files, root, frameworks))
+            out.write(stats)
         print(f"Output written to {args.output}")
         print(f"Files: {file_count}, Types: {type_count}, Members: {member_count}")
     else:
-        print(output + stats)
+        print(format_output(files, root, frameworks) + stats)
 
 
 if __name__ == '__main__':
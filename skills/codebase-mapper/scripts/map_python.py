@@ -12,11 +12,16 @@ Usage:
 
 import ast
 import argparse
+import hashlib
 import os
+import pickle
+import re
 import sys
 from pathlib import Path
-from collections import defaultdict
-from typing import NamedTuple
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from typing import NamedTuple, TextIO
 
 
 class ClassInfo(NamedTuple):
@@ -41,6 +46,12 @@ DEFAULT_EXCLUDES = {
     '.mypy_cache', 'eggs', '*.egg-info', '.eggs'
 }
 
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'codebase-mapper'
+
+# Decorator and import names repeat across thousands of modules; share one copy
+# (identifiers from ast are already interned by the parser)
+_intern = sys.intern
+
 FRAMEWORK_INDICATORS = {
     'fastapi': 'FastAPI',
     'flask': 'Flask',
@@ -53,13 +64,54 @@ FRAMEWORK_INDICATORS = {
     'aiohttp': 'aiohttp',
 }
 
+# Import statements, for modules with no class or def that skip ast entirely
+IMPORT_PATTERN = re.compile(
+    r'^[ \t]*(?:import[ \t]+(?P<names>[\w. \t,]+)|from[ \t]+\.*(?P<module>\w[\w.]*)[ \t]+import\b)',
+    re.MULTILINE
+)
+
+# Statement types parse_module looks at; blocks are searched one level at a
+# time for classes and imports, while function bodies are never entered.
+NODE_KINDS: dict[type, str] = {
+    ast.ClassDef: 'class',
+    ast.FunctionDef: 'function',
+    ast.AsyncFunctionDef: 'function',
+    ast.Import: 'import',
+    ast.ImportFrom: 'import_from',
+    ast.If: 'block',
+    ast.For: 'block',
+    ast.AsyncFor: 'block',
+    ast.While: 'block',
+    ast.Try: 'block',
+    ast.With: 'block',
+    ast.AsyncWith: 'block',
+    ast.Match: 'block',
+}
+if hasattr(ast, 'TryStar'):
+    NODE_KINDS[ast.TryStar] = 'block'
+
 
-def should_exclude(path: Path, excludes: set[str]) -> bool:
-    """Check if path should be excluded."""
-    for part in path.parts:
-        if part in excludes or part.startswith('.'):
-            return True
-    return False
+def should_exclude(name: str, excludes: frozenset[str]) -> bool:
+    """Check if a directory or file name should be excluded."""
+    return name in excludes or name[:1] == '.'
+
+
+def find_py_files(directory: str, excludes: frozenset[str]) -> Iterator[Path]:
+    """Recursively find Python files, without descending into excluded directories."""
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if should_exclude(entry.name, excludes):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield Path(entry.path)
+    except (PermissionError, NotADirectoryError):
+        return
+    for subdir in subdirs:
+        yield from find_py_files(subdir, excludes)
 
 
 def extract_decorator_name(decorator: ast.expr) -> str:
@@ -80,8 +132,8 @@ def extract_decorator_name(decorator: ast.expr) -> str:
     return '?'
 
 
-def parse_class(node: ast.ClassDef, depth: str) -> ClassInfo:
-    """Extract class information from AST node."""
+def _parse_class_classes(node: ast.ClassDef) -> ClassInfo:
+    """Extract class information from AST node, without its methods."""
     bases = []
     for base in node.bases:
         if isinstance(base, ast.Name):
@@ -89,82 +141,198 @@ def parse_class(node: ast.ClassDef, depth: str) -> ClassInfo:
         elif isinstance(base, ast.Attribute):
             bases.append(base.attr)
 
-    decorators = [extract_decorator_name(d) for d in node.decorator_list]
+    decorators = [_intern(extract_decorator_name(d)) for d in node.decorator_list]
     is_dataclass = 'dataclass' in decorators
 
-    methods = []
-    properties = []
-
-    if depth != 'classes':
-        for item in node.body:
-            if isinstance(item, ast.FunctionDef) or isinstance(item, ast.AsyncFunctionDef):
-                # Skip private methods unless full depth
-                if depth != 'full' and item.name.startswith('_') and not item.name.startswith('__'):
-                    continue
-                # Skip dunder methods except __init__
-                if item.name.startswith('__') and item.name != '__init__':
-                    continue
-
-                item_decorators = [extract_decorator_name(d) for d in item.decorator_list]
-                if 'property' in item_decorators:
-                    properties.append(item.name)
-                else:
-                    prefix = 'async ' if isinstance(item, ast.AsyncFunctionDef) else ''
-                    methods.append(f"{prefix}{item.name}()")
-
     return ClassInfo(
         name=node.name,
         bases=bases,
-        methods=methods,
+        methods=[],
         decorators=decorators,
-        properties=properties,
+        properties=[],
         is_dataclass=is_dataclass,
     )
 
 
+def _parse_methods(node: ast.ClassDef, public_only: bool) -> tuple[list[str], list[str]]:
+    """Collect the methods and properties defined in a class body."""
+    methods = []
+    properties = []
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef) or isinstance(item, ast.AsyncFunctionDef):
+            # Skip private methods unless full depth
+            if public_only and item.name.startswith('_') and not item.name.startswith('__'):
+                continue
+            # Skip dunder methods except __init__
+            if item.name.startswith('__') and item.name != '__init__':
+                continue
+
+            item_decorators = [extract_decorator_name(d) for d in item.decorator_list]
+            if 'property' in item_decorators:
+                properties.append(item.name)
+            else:
+                prefix = 'async ' if isinstance(item, ast.AsyncFunctionDef) else ''
+                methods.append(f"{prefix}{item.name}()")
+    return methods, properties
+
+
+def _parse_class_methods(node: ast.ClassDef) -> ClassInfo:
+    """Extract class information from AST node, with its public methods."""
+    methods, properties = _parse_methods(node, public_only=True)
+    return _parse_class_classes(node)._replace(methods=methods, properties=properties)
+
+
+def _parse_class_full(node: ast.ClassDef) -> ClassInfo:
+    """Extract class information from AST node, with all of its methods."""
+    methods, properties = _parse_methods(node, public_only=False)
+    return _parse_class_classes(node)._replace(methods=methods, properties=properties)
+
+
+# Class parser per --depth, so the method loop never re-checks the depth
+PARSE_CLASS = {
+    'classes': _parse_class_classes,
+    'methods': _parse_class_methods,
+    'full': _parse_class_full,
+}
+
+
+def scan_imports(content: str) -> list[str]:
+    """Find the top-level packages imported by a module without parsing it."""
+    imports: set[str] = set()
+    for m in IMPORT_PATTERN.finditer(content):
+        if m.group('module'):
+            imports.add(_intern(m.group('module').partition('.')[0]))
+            continue
+        for name in m.group('names').split(','):
+            name = name.split(maxsplit=1)[0] if name.strip() else ''
+            if name:
+                imports.add(_intern(name.partition('.')[0]))
+    return list(imports)
+
+
 def parse_module(filepath: Path, depth: str) -> ModuleInfo | None:
     """Parse a Python module and extract structure."""
+    # ast handles any newline style, so skip read_text's newline translation
     try:
-        content = filepath.read_text(encoding='utf-8')
+        content = filepath.read_bytes().decode('utf-8')
     except UnicodeDecodeError:
         print(f"Warning: Skipping non-UTF8 file: {filepath}", file=sys.stderr)
         return None
 
+    # Without 'class' or 'def' anywhere (e.g. most __init__.py files) there is
+    # nothing but imports to find, and a regex scan is enough. The scan reads
+    # one statement per line, so ';'-joined statements still go through ast
+    if 'class' not in content and 'def' not in content and ';' not in content:
+        return ModuleInfo(
+            path=str(filepath),
+            classes=[],
+            functions=[],
+            imports=scan_imports(content),
+        )
+
     try:
-        tree = ast.parse(content, filename=str(filepath))
+        tree = ast.parse(content, filename=str(filepath), type_comments=False)
     except SyntaxError as e:
         print(f"Warning: Syntax error in {filepath}: {e}", file=sys.stderr)
         return None
 
+    parse_class = PARSE_CLASS[depth]
     classes = []
     functions = []
-    imports = []
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            classes.append(parse_class(node, depth))
-        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            # Only top-level functions
-            if node.col_offset == 0:
-                if depth != 'classes':
+    imports: set[str] = set()
+
+    # Breadth-first over module-level blocks (e.g. `if TYPE_CHECKING:`, `try:`)
+    bodies = deque([(tree.body, True)])
+    while bodies:
+        body, top_level = bodies.popleft()
+        for node in body:
+            kind = NODE_KINDS.get(type(node))
+            if kind is None:
+                continue
+            if kind == 'class':
+                classes.append(parse_class(node))
+            elif kind == 'function':
+                # Only top-level functions
+                if top_level and depth != 'classes':
                     if not node.name.startswith('_') or depth == 'full':
                         prefix = 'async ' if isinstance(node, ast.AsyncFunctionDef) else ''
                         functions.append(f"{prefix}{node.name}()")
-        elif isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.append(alias.name.split('.')[0])
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                imports.append(node.module.split('.')[0])
+            elif kind == 'import':
+                for alias in node.names:
+                    imports.add(_intern(alias.name.partition('.')[0]))
+            elif kind == 'import_from':
+                if node.module:
+                    imports.add(_intern(node.module.partition('.')[0]))
+            else:
+                bodies.append((getattr(node, 'body', []), False))
+                for handler in getattr(node, 'handlers', ()):
+                    bodies.append((handler.body, False))
+                for case in getattr(node, 'cases', ()):
+                    bodies.append((case.body, False))
+                bodies.append((getattr(node, 'orelse', []), False))
+                bodies.append((getattr(node, 'finalbody', []), False))
 
     return ModuleInfo(
         path=str(filepath),
         classes=classes,
         functions=functions,
-        imports=list(set(imports)),
+        imports=list(imports),
     )
 
 
+def parse_files(parse: Callable[[Path], ModuleInfo | None], paths: list[Path],
+                jobs: int) -> Iterator[ModuleInfo | None]:
+    """Parse files across worker processes, yielding results in input order."""
+    # A single chunk would go to one worker anyway, so small batches (e.g. a
+    # warm cache) skip starting the pool and importing its machinery
+    chunksize = 16
+    if jobs <= 1 or len(paths) <= chunksize:
+        yield from map(parse, paths)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(parse, paths, chunksize=chunksize)
+
+
+def cache_file_for(root: Path, depth: str) -> Path:
+    """Location of the parse cache for a source root and depth."""
+    digest = hashlib.sha1(str(root).encode('utf-8')).hexdigest()[:16]
+    return CACHE_DIR / f'py-{digest}-{depth}.pkl'
+
+
+def parser_version() -> str:
+    """Digest of this script, so cached results never outlive a parser change."""
+    return hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+
+def cache_key(path: Path) -> tuple[str, int, int]:
+    """Key a file by path, modification time and size."""
+    st = path.stat()
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def load_cache(cache_file: Path) -> dict[tuple[str, int, int], ModuleInfo]:
+    """Load cached parse results, treating a missing or stale cache as empty."""
+    try:
+        with cache_file.open('rb') as f:
+            version, entries = pickle.load(f)
+    except Exception:
+        return {}
+    return entries if version == parser_version() else {}
+
+
+def save_cache(cache_file: Path, entries: dict[tuple[str, int, int], ModuleInfo]) -> None:
+    """Write parse results for the next run; failures only cost a re-parse."""
+    tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_file.open('wb') as f:
+            pickle.dump((parser_version(), entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write cache {cache_file}: {e}", file=sys.stderr)
+
+
 def detect_frameworks(all_imports: set[str]) -> list[str]:
     """Detect frameworks from imports."""
     detected = []
@@ -176,10 +344,11 @@ def detect_frameworks(all_imports: set[str]) -> list[str]:
 
 def format_class(cls: ClassInfo) -> str:
     """Format a class for output."""
-    parts = [f"`{cls.name}"]
+    head = [f"`{cls.name}"]
     if cls.bases:
-        parts[0] += f"({', '.join(cls.bases)})"
-    parts[0] += '`'
+        head.append(f"({', '.join(cls.bases)})")
+    head.append('`')
+    parts = [''.join(head)]
 
     if cls.is_dataclass:
         parts.append('[dataclass]')
@@ -192,34 +361,32 @@ def format_class(cls: ClassInfo) -> str:
     return ' '.join(parts)
 
 
-def format_output(modules: dict[str, list[ModuleInfo]], root: Path, frameworks: list[str]) -> str:
-    """Format the parsed modules into markdown output."""
-    lines = []
-    lines.append("### Python: " + str(root.name) + "/")
+def iter_output_lines(modules: dict[str, list[ModuleInfo]], root: Path, frameworks: list[str]) -> Iterator[str]:
+    """Yield the markdown output for the parsed modules, line by line."""
+    yield "### Python: " + str(root.name) + "/"
 
     if frameworks:
-        lines.append(f"**Frameworks detected:** {', '.join(frameworks)}")
-        lines.append("")
+        yield f"**Frameworks detected:** {', '.join(frameworks)}"
+        yield ""
 
-    # Group by directory
-    dir_modules: dict[str, list[ModuleInfo]] = defaultdict(list)
+    # Group by directory, keeping each module's relative path
+    dir_modules: dict[str, list[tuple[Path, ModuleInfo]]] = defaultdict(list)
     for path, mods in modules.items():
         for mod in mods:
             rel_path = Path(mod.path).relative_to(root)
             dir_name = str(rel_path.parent) if rel_path.parent != Path('.') else ''
-            dir_modules[dir_name].append(mod)
+            dir_modules[dir_name].append((rel_path, mod))
 
     # Sort directories
     for dir_name in sorted(dir_modules.keys()):
         mods = dir_modules[dir_name]
         if dir_name:
-            lines.append(f"- `{dir_name}/`")
+            yield f"- `{dir_name}/`"
             indent = "  "
         else:
             indent = ""
 
-        for mod in sorted(mods, key=lambda m: m.path):
-            rel_path = Path(mod.path).relative_to(root)
+        for rel_path, mod in sorted(mods, key=lambda entry: entry[1].path):
             filename = rel_path.name
 
             # Skip __init__.py unless it has meaningful content
@@ -239,9 +406,20 @@ def format_output(modules: dict[str, list[ModuleInfo]], root: Path, frameworks:
                 mod_parts.append(f"{indent}  - Functions: {funcs}")
 
             if len(mod_parts) > 1:
-                lines.extend(mod_parts)
+                yield from mod_parts
+
 
-    return '\n'.join(lines)
+def format_output(modules: dict[str, list[ModuleInfo]], root: Path, frameworks: list[str]) -> str:
+    """Format the parsed modules into markdown output."""
+    return '\n'.join(iter_output_lines(modules, root, frameworks))
+
+
+def write_output(out: TextIO, lines: Iterable[str]) -> None:
+    """Write output lines to a stream as they are produced, newline-separated."""
+    sep = ''
+    for line in lines:
+        out.write(sep + line)
+        sep = '\n'
 
 
 def main():
@@ -252,6 +430,10 @@ def main():
                         help='Output depth level')
     parser.add_argument('--exclude', type=str, default='',
                         help='Comma-separated directories to exclude')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Parallel parser processes (default: CPU count, 1 disables)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse every file instead of reusing results from the last run')
     args = parser.parse_args()
 
     root = args.root.resolve()
@@ -262,6 +444,7 @@ def main():
     excludes = DEFAULT_EXCLUDES.copy()
     if args.exclude:
         excludes.update(args.exclude.split(','))
+    excludes = frozenset(excludes)
 
     # Collect all Python files
     modules: dict[str, list[ModuleInfo]] = defaultdict(list)
@@ -270,13 +453,21 @@ def main():
     class_count = 0
     method_count = 0
 
-    for py_file in root.rglob('*.py'):
-        rel_path = py_file.relative_to(root)
-        if should_exclude(rel_path, excludes):
-            continue
+    py_files = list(find_py_files(str(root), excludes))
+
+    # Only files changed since the last run are parsed
+    cache_file = None if args.no_cache else cache_file_for(root, args.depth)
+    cached = load_cache(cache_file) if cache_file else {}
+    keys = [cache_key(py_file) for py_file in py_files]
+    stale = [py_file for py_file, key in zip(py_files, keys) if key not in cached]
+    parse = partial(parse_module, depth=args.depth)
+    parsed = dict(zip(stale, parse_files(parse, stale, args.jobs)))
 
-        module = parse_module(py_file, args.depth)
+    entries = {}
+    for py_file, key in zip(py_files, keys):
+        module = cached[key] if key in cached else parsed[py_file]
         if module:
+            entries[key] = module
             modules[str(py_file.parent)].append(module)
             all_imports.update(module.imports)
             file_count += 1
@@ -284,18 +475,24 @@ def main():
             for cls in module.classes:
                 method_count += len(cls.methods)
 
+    # A warm run leaves the cache untouched; deleted files drop out of entries
+    if cache_file and (any(parsed.values()) or len(entries) != len(cached)):
+        save_cache(cache_file, entries)
+
     frameworks = detect_frameworks(all_imports)
-    output = format_output(modules, root, frameworks)
 
     # Add stats as comment
     stats = f"\n<!-- Python: {file_count} files, {class_count} classes, {method_count} methods -->\n"
 
     if args.output:
-        args.output.write_text(output + stats, encoding='utf-8')
+        # Stream to the file rather than building the whole map in memory first
+        with args.output.open('w', encoding='utf-8', buffering=1024 * 1024) as out:
+            write_output(out, iter_output_lines(modules, root, frameworks))
+            out.write(stats)
         print(f"Output written to {args.output}")
         print(f"Files: {file_count}, Classes: {class_count}, Methods: {method_count}")
     else:
-        print(output + stats)
+        print(format_output(modules, root, frameworks) + stats)
 
 
 if __name__ == '__main__':
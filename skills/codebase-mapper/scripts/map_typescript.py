@@ -18,11 +18,18 @@ Usage:
 """
 
 import argparse
+import bisect
+import hashlib
+import mmap
+import os
+import pickle
 import re
 import sys
 from pathlib import Path
 from collections import defaultdict
-from typing import NamedTuple
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from typing import NamedTuple, TextIO
 
 
 class MemberInfo(NamedTuple):
@@ -46,6 +53,26 @@ class FileInfo(NamedTuple):
     imports: list[str]
 
 
+class Patterns(NamedTuple):
+    """The patterns parse_content scans with, compiled for text or for bytes."""
+    comment: re.Pattern
+    imports: re.Pattern
+    construct: re.Pattern
+    constructs: dict[str, re.Pattern]
+    construct_starts: dict
+    keywords: tuple
+    method: re.Pattern
+    jsx_return: re.Pattern
+
+
+class CacheEntry(NamedTuple):
+    """A parsed file with the metadata and content digest it was parsed from."""
+    mtime_ns: int
+    size: int
+    digest: bytes
+    file_info: FileInfo
+
+
 DEFAULT_EXCLUDES = {
     'node_modules', 'dist', 'build', '.git', 'coverage',
     '__tests__', '__mocks__', '.next', '.nuxt', '.output'
@@ -67,7 +94,29 @@ FRAMEWORK_INDICATORS = {
     '@trpc': 'tRPC',
 }
 
+TS_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'codebase-mapper'
+
+# Decorators, bases and import paths repeat across thousands of files; share one copy
+_intern = sys.intern
+
 # Regex patterns
+# Line and block comments, in one pass. A '//' starts a line comment even inside
+# a block comment, so a block comment only ends at a '*/' that is not the start
+# of a '//'. The body is captured in a lookahead and matched back, which makes
+# it atomic (no possessive quantifiers before 3.11): unterminated comments do
+# not backtrack, and '*/' can never close inside a skipped '//' run
+COMMENT_PATTERN = re.compile(
+    r'''
+    //[^\n]*
+    | /\*
+      (?=(?P<body>(?: //[^\n]* | [^/*]+ | /(?!/) | \*(?!/(?!/)) )*))(?P=body)
+      \*/(?!/)
+    ''',
+    re.VERBOSE
+)
+
 IMPORT_PATTERN = re.compile(
     r'''import\s+(?:
         (?:type\s+)?
@@ -164,8 +213,49 @@ REACT_FC_PATTERN = re.compile(
     re.VERBOSE
 )
 
+# Every construct above, found in one scan. The scan matches zero-width at each
+# offset where any of them starts; parse_content then re-matches the individual
+# patterns there.
+CONSTRUCT_PATTERNS = {
+    'class': CLASS_PATTERN,
+    'interface': INTERFACE_PATTERN,
+    'type': TYPE_ALIAS_PATTERN,
+    'enum': ENUM_PATTERN,
+    'function': FUNCTION_PATTERN,
+    'component': REACT_FC_PATTERN,
+    'arrow': ARROW_FUNCTION_PATTERN,
+}
+# The kinds that can start with each character, so the scan skips every other
+# offset cheaply and only the possible patterns are re-matched
+CONSTRUCT_STARTS = {
+    '@': ('class',),
+    'a': ('class', 'function'),  # abstract, async
+    'c': ('class', 'enum', 'component', 'arrow'),  # class, const
+    'd': ('function',),  # default
+    'e': tuple(CONSTRUCT_PATTERNS),  # export, enum
+    'f': ('function',),
+    'i': ('interface',),
+    'l': ('component', 'arrow'),  # let
+    't': ('type',),
+}
+CONSTRUCT_PATTERN = re.compile(
+    '(?=[' + ''.join(CONSTRUCT_STARTS) + '])'
+    '(?=' + '|'.join(
+        '(?:' + re.sub(r'\(\?P<\w+>', '(?:', pattern.pattern) + ')'
+        for pattern in CONSTRUCT_PATTERNS.values()
+    ) + ')',
+    re.VERBOSE
+)
+
+# Literals every construct match contains; a file with none of them has no
+# constructs to find
+CONSTRUCT_KEYWORDS = (
+    'class', 'interface', 'type', 'enum', 'function', 'FC', 'FunctionComponent', '=>'
+)
+
 METHOD_PATTERN = re.compile(
     r'''
+    (?:(?<![\w\s])|\b|(?=public|private|protected|static|async))  # Not inside a word or run
     (?P<modifier>public|private|protected|static|async|\s)*
     (?P<name>\w+)
     (?:<[^>]+>)?
@@ -176,64 +266,161 @@ METHOD_PATTERN = re.compile(
     re.VERBOSE
 )
 
+# Every offset where a JSX return starts (zero-width, so overlapping returns
+# are all found)
+JSX_RETURN_PATTERN = re.compile(r'(?=return\s*(?:\([^)]*)?<)')
+
+TEXT_PATTERNS = Patterns(
+    comment=COMMENT_PATTERN,
+    imports=IMPORT_PATTERN,
+    construct=CONSTRUCT_PATTERN,
+    constructs=CONSTRUCT_PATTERNS,
+    construct_starts=CONSTRUCT_STARTS,
+    keywords=CONSTRUCT_KEYWORDS,
+    method=METHOD_PATTERN,
+    jsx_return=JSX_RETURN_PATTERN,
+)
 
-def should_exclude(path: Path, excludes: set[str]) -> bool:
-    """Check if path should be excluded."""
-    for part in path.parts:
-        if part in excludes or part.startswith('.'):
-            return True
-    return False
+
+def bytes_pattern(pattern: re.Pattern) -> re.Pattern:
+    """Compile a text pattern for matching ASCII bytes."""
+    return re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
+
+
+# Files are scanned as bytes when they are plain ASCII with no lone '\r'
+# (read_text would turn it into a newline); \w and \s then match the same
+# characters as in the text patterns. Large files are memory-mapped.
+MMAP_THRESHOLD = 16 * 1024
+BYTES_PATTERNS = Patterns(
+    comment=bytes_pattern(COMMENT_PATTERN),
+    imports=bytes_pattern(IMPORT_PATTERN),
+    construct=bytes_pattern(CONSTRUCT_PATTERN),
+    constructs={kind: bytes_pattern(pattern) for kind, pattern in CONSTRUCT_PATTERNS.items()},
+    construct_starts={ord(char): kinds for char, kinds in CONSTRUCT_STARTS.items()},  # Bytes index to ints
+    keywords=tuple(keyword.encode() for keyword in CONSTRUCT_KEYWORDS),
+    method=bytes_pattern(METHOD_PATTERN),
+    jsx_return=bytes_pattern(JSX_RETURN_PATTERN),
+)
+NEEDS_TEXT_PATTERN = re.compile(rb'[^\x00-\x7f]|\r(?!\n)')
+
+
+def should_exclude(name: str, excludes: frozenset[str]) -> bool:
+    """Check if a directory or file name should be excluded."""
+    return name in excludes or name[:1] == '.'
+
+
+def find_ts_files(directory: str, excludes: frozenset[str]) -> Iterator[str]:
+    """Recursively find TS/JS source files, without descending into excluded directories."""
+    # Paths stay plain strings; nothing downstream needs a Path object per file
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if should_exclude(entry.name, excludes):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                # Skip declaration files
+                elif entry.name.endswith(TS_EXTENSIONS) and not entry.name.endswith('.d.ts'):
+                    yield entry.path
+    except (PermissionError, NotADirectoryError):
+        return
+    for subdir in subdirs:
+        yield from find_ts_files(subdir, excludes)
 
 
 def extract_decorators(decorator_str: str) -> list[str]:
     """Extract decorator names from decorator string."""
     if not decorator_str:
         return []
-    return re.findall(r'@(\w+)', decorator_str)
+    return [_intern(d) for d in re.findall(r'@(\w+)', decorator_str)]
+
 
+def group_text(match: re.Match, group: str | int) -> str | None:
+    """Get a match group as text, decoding groups matched on bytes."""
+    value = match.group(group)
+    if isinstance(value, bytes):
+        return value.decode('ascii')
+    return value
 
-def find_block_end(content: str, start: int) -> int:
+
+def find_block_end(content: str | bytes, start: int) -> int:
     """Find the end of a block by matching braces."""
+    open_brace, close_brace = ('{', '}') if isinstance(content, str) else (b'{', b'}')
+    # Jump between braces with find() rather than stepping through every character
     depth = 0
-    i = start
-    while i < len(content):
-        if content[i] == '{':
+    next_open = content.find(open_brace, start)
+    next_close = content.find(close_brace, start)
+    while next_close != -1:
+        if next_open != -1 and next_open < next_close:
             depth += 1
-        elif content[i] == '}':
+            next_open = content.find(open_brace, next_open + 1)
+        else:
             depth -= 1
             if depth == 0:
-                return i
-        i += 1
+                return next_close
+            next_close = content.find(close_brace, next_close + 1)
     return len(content)
 
 
-def is_react_component(name: str, content: str) -> bool:
+def is_react_component(name: str, content: str | bytes, jsx_sites: list[int]) -> bool:
     """Check if a function looks like a React component."""
     # Component names are PascalCase
     if not name[0].isupper():
         return False
-    # Check for JSX return
-    if re.search(rf'{name}[^{{]*\{{[^}}]*return\s*\([^)]*<', content):
-        return True
-    if re.search(rf'{name}[^{{]*\{{[^}}]*return\s*<', content):
-        return True
+    # Check for a JSX return between the first '{' after any use of the name
+    # and the next '}'
+    if isinstance(content, bytes):
+        name, open_brace, close_brace = name.encode(), b'{', b'}'
+    else:
+        open_brace, close_brace = '{', '}'
+    pos = content.find(name)
+    while pos != -1 and jsx_sites:
+        body_start = content.find(open_brace, pos + len(name))
+        if body_start == -1:
+            return False
+        body_end = content.find(close_brace, body_start + 1)
+        if body_end == -1:
+            body_end = len(content)
+        i = bisect.bisect_right(jsx_sites, body_start)
+        if i < len(jsx_sites) and jsx_sites[i] < body_end:
+            return True
+        # Later uses of the name up to this brace lead to the same body
+        pos = content.find(name, body_start + 1)
     return False
 
 
-def parse_class(match: re.Match, content: str, depth: str) -> TypeInfo:
-    """Parse a class from regex match."""
-    decorators = extract_decorators(match.group('decorators') or '')
+def scan_imports(content: str | bytes | mmap.mmap, pattern: re.Pattern) -> list[str]:
+    """Find import paths, only trying the pattern where 'import' appears."""
+    keyword = 'import' if isinstance(content, str) else b'import'
+    imports = []
+    pos = content.find(keyword)
+    while pos != -1:
+        # Anchored at the keyword, so multi-line imports still match whole
+        match = pattern.match(content, pos)
+        if match:
+            imports.append(_intern(group_text(match, 1)))
+            pos = match.end()
+        else:
+            pos += 1
+        pos = content.find(keyword, pos)
+    return imports
+
+
+def _parse_class_classes(match: re.Match, content: str | bytes, patterns: Patterns) -> TypeInfo:
+    """Parse a class from regex match, without its methods."""
+    decorators = extract_decorators(group_text(match, 'decorators') or '')
     is_exported = bool(match.group('export'))
-    name = match.group('name')
+    name = group_text(match, 'name')
 
     bases = []
     if match.group('extends'):
-        bases.append(match.group('extends').split('<')[0].strip())
+        bases.append(_intern(group_text(match, 'extends').split('<')[0].strip()))
     if match.group('implements'):
-        for impl in match.group('implements').split(','):
+        for impl in group_text(match, 'implements').split(','):
             impl = impl.split('<')[0].strip()
             if impl:
-                bases.append(impl)
+                bases.append(_intern(impl))
 
     # Determine kind
     kind = 'class'
@@ -242,79 +429,136 @@ def parse_class(match: re.Match, content: str, depth: str) -> TypeInfo:
     elif 'Injectable' in decorators:
         kind = 'service'
 
-    members = []
-    if depth != 'classes':
-        # Find class body
-        class_start = match.end()
-        class_end = find_block_end(content, match.start())
-        class_body = content[class_start:class_end]
-
-        for m in METHOD_PATTERN.finditer(class_body):
-            method_name = m.group('name')
-            modifiers = m.group('modifier') or ''
-
-            # Skip private unless full depth
-            if depth != 'full' and 'private' in modifiers:
-                continue
-
-            # Skip constructor and lifecycle methods
-            if method_name in ['constructor', 'ngOnInit', 'ngOnDestroy', 'componentDidMount',
-                               'componentWillUnmount', 'render', 'get', 'set']:
-                continue
-
-            is_async = 'async' in modifiers
-            members.append(MemberInfo(
-                name=f"{method_name}()",
-                kind='method',
-                is_async=is_async
-            ))
-
     return TypeInfo(
         name=name,
         kind=kind,
         bases=bases,
-        members=members,
+        members=[],
         decorators=decorators,
         is_exported=is_exported
     )
 
 
-def parse_file(filepath: Path, depth: str) -> FileInfo | None:
+def _parse_methods(match: re.Match, content: str | bytes, patterns: Patterns,
+                   public_only: bool) -> list[MemberInfo]:
+    """Find the methods of a class, skipping constructors and lifecycle hooks."""
+    # Find class body
+    class_start = match.end()
+    class_end = find_block_end(content, match.start())
+    class_body = content[class_start:class_end]
+
+    members = []
+    for m in patterns.method.finditer(class_body):
+        method_name = group_text(m, 'name')
+        modifiers = group_text(m, 'modifier') or ''
+
+        # Skip private unless full depth
+        if public_only and 'private' in modifiers:
+            continue
+
+        # Skip constructor and lifecycle methods
+        if method_name in ['constructor', 'ngOnInit', 'ngOnDestroy', 'componentDidMount',
+                           'componentWillUnmount', 'render', 'get', 'set']:
+            continue
+
+        # Built positionally; NamedTuple keyword arguments cost more, per method
+        is_async = 'async' in modifiers
+        members.append(MemberInfo(f"{method_name}()", 'method', is_async))
+
+    return members
+
+
+def _parse_class_methods(match: re.Match, content: str | bytes, patterns: Patterns) -> TypeInfo:
+    """Parse a class from regex match, with its public methods."""
+    return _parse_class_classes(match, content, patterns)._replace(
+        members=_parse_methods(match, content, patterns, public_only=True)
+    )
+
+
+def _parse_class_full(match: re.Match, content: str | bytes, patterns: Patterns) -> TypeInfo:
+    """Parse a class from regex match, with all of its methods."""
+    return _parse_class_classes(match, content, patterns)._replace(
+        members=_parse_methods(match, content, patterns, public_only=False)
+    )
+
+
+# Class parser per --depth, so the method loop never re-checks the depth
+PARSE_CLASS = {
+    'classes': _parse_class_classes,
+    'methods': _parse_class_methods,
+    'full': _parse_class_full,
+}
+
+
+def parse_file(filepath: str, depth: str) -> FileInfo | None:
     """Parse a TypeScript file and extract structure."""
+    if os.stat(filepath).st_size >= MMAP_THRESHOLD:
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            if not NEEDS_TEXT_PATTERN.search(content):
+                return parse_content(filepath, content, BYTES_PATTERNS, depth)
+    else:
+        with open(filepath, 'rb') as f:
+            content = f.read()
+        if not NEEDS_TEXT_PATTERN.search(content):
+            return parse_content(filepath, content, BYTES_PATTERNS, depth)
+
     try:
-        content = filepath.read_text(encoding='utf-8')
+        with open(filepath, encoding='utf-8') as f:
+            content = f.read()
     except UnicodeDecodeError:
         print(f"Warning: Skipping non-UTF8 file: {filepath}", file=sys.stderr)
         return None
+    return parse_content(filepath, content, TEXT_PATTERNS, depth)
 
-    # Remove comments to avoid false matches
-    content_no_comments = re.sub(r'//.*$', '', content, flags=re.MULTILINE)
-    content_no_comments = re.sub(r'/\*.*?\*/', '', content_no_comments, flags=re.DOTALL)
 
-    # Extract imports
-    imports = [m.group(1) for m in IMPORT_PATTERN.finditer(content)]
+def parse_content(filepath: str, content: str | bytes | mmap.mmap, patterns: Patterns, depth: str) -> FileInfo:
+    """Extract structure from file content, as text or as ASCII bytes."""
+    # Remove comments to avoid false matches ('' or b'', to suit the content)
+    content_no_comments = patterns.comment.sub(content[:0], content)
 
+    # Extract imports
+    imports = scan_imports(content, patterns.imports)
+
+    if not any(keyword in content_no_comments for keyword in patterns.keywords):
+        return FileInfo(path=filepath, types=[], imports=imports)
+
+    # Find all constructs in one pass. A kind only takes a match that starts
+    # after its previous one ends, so each kind gets exactly the matches its
+    # own finditer would have found.
+    found: dict[str, list[re.Match]] = {kind: [] for kind in patterns.constructs}
+    next_start = dict.fromkeys(patterns.constructs, 0)
+    for hit in patterns.construct.finditer(content_no_comments):
+        start = hit.start()
+        for kind in patterns.construct_starts[content_no_comments[start]]:
+            if start >= next_start[kind]:
+                match = patterns.constructs[kind].match(content_no_comments, start)
+                if match:
+                    found[kind].append(match)
+                    next_start[kind] = match.end()
+
+    jsx_sites = [m.start() for m in patterns.jsx_return.finditer(content_no_comments)]
     types = []
 
     # Parse classes
-    for match in CLASS_PATTERN.finditer(content_no_comments):
-        types.append(parse_class(match, content_no_comments, depth))
+    parse_class = PARSE_CLASS[depth]
+    for match in found['class']:
+        types.append(parse_class(match, content_no_comments, patterns))
 
     # Parse interfaces
-    for match in INTERFACE_PATTERN.finditer(content_no_comments):
+    for match in found['interface']:
         types.append(TypeInfo(
-            name=match.group('name'),
+            name=group_text(match, 'name'),
             kind='interface',
-            bases=[match.group('extends')] if match.group('extends') else [],
+            bases=[_intern(group_text(match, 'extends'))] if match.group('extends') else [],
             members=[],
             decorators=[],
             is_exported=bool(match.group('export'))
         ))
 
     # Parse type aliases
-    for match in TYPE_ALIAS_PATTERN.finditer(content_no_comments):
+    for match in found['type']:
         types.append(TypeInfo(
-            name=match.group('name'),
+            name=group_text(match, 'name'),
             kind='type',
             bases=[],
             members=[],
@@ -323,9 +567,9 @@ def parse_file(filepath: Path, depth: str) -> FileInfo | None:
         ))
 
     # Parse enums
-    for match in ENUM_PATTERN.finditer(content_no_comments):
+    for match in found['enum']:
         types.append(TypeInfo(
-            name=match.group('name'),
+            name=group_text(match, 'name'),
             kind='enum',
             bases=[],
             members=[],
@@ -334,9 +578,9 @@ def parse_file(filepath: Path, depth: str) -> FileInfo | None:
         ))
 
     # Parse functions
-    for match in FUNCTION_PATTERN.finditer(content_no_comments):
-        name = match.group('name')
-        kind = 'component' if is_react_component(name, content_no_comments) else 'function'
+    for match in found['function']:
+        name = group_text(match, 'name')
+        kind = 'component' if is_react_component(name, content_no_comments, jsx_sites) else 'function'
         types.append(TypeInfo(
             name=name,
             kind=kind,
@@ -347,9 +591,9 @@ def parse_file(filepath: Path, depth: str) -> FileInfo | None:
         ))
 
     # Parse React FC components
-    for match in REACT_FC_PATTERN.finditer(content_no_comments):
+    for match in found['component']:
         types.append(TypeInfo(
-            name=match.group('name'),
+            name=group_text(match, 'name'),
             kind='component',
             bases=['FC'],
             members=[],
@@ -358,38 +602,98 @@ def parse_file(filepath: Path, depth: str) -> FileInfo | None:
         ))
 
     # Parse arrow functions (only exported ones at module level)
-    for match in ARROW_FUNCTION_PATTERN.finditer(content_no_comments):
+    names = {t.name for t in types}
+    for match in found['arrow']:
         if not match.group('export'):
             continue
-        name = match.group('name')
-        kind = 'component' if is_react_component(name, content_no_comments) else 'function'
+        name = group_text(match, 'name')
         # Avoid duplicates
-        if not any(t.name == name for t in types):
-            types.append(TypeInfo(
-                name=name,
-                kind=kind,
-                bases=[],
-                members=[],
-                decorators=[],
-                is_exported=True
-            ))
+        if name in names:
+            continue
+        kind = 'component' if is_react_component(name, content_no_comments, jsx_sites) else 'function'
+        types.append(TypeInfo(
+            name=name,
+            kind=kind,
+            bases=[],
+            members=[],
+            decorators=[],
+            is_exported=True
+        ))
+        names.add(name)
 
     return FileInfo(
-        path=str(filepath),
+        path=filepath,
         types=types,
         imports=imports
     )
 
 
+def parse_files(parse: Callable[[str], FileInfo | None], paths: list[str],
+                jobs: int) -> Iterator[FileInfo | None]:
+    """Parse files across worker processes, yielding results in input order."""
+    # A single chunk would go to one worker anyway, so small batches skip
+    # starting the pool and importing its machinery
+    chunksize = 32
+    if jobs <= 1 or len(paths) <= chunksize:
+        yield from map(parse, paths)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(parse, paths, chunksize=chunksize)
+
+
+def cache_file_for(cache_dir: Path, root: Path, depth: str) -> Path:
+    """Location of the parse cache for a source root and depth."""
+    digest = hashlib.sha1(str(root).encode('utf-8')).hexdigest()[:16]
+    return cache_dir / f'ts-{digest}-{depth}.pkl'
+
+
+def parser_version() -> str:
+    """Digest of this script, so cached results never outlive a parser change."""
+    return hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+
+def content_digest(path: str) -> bytes:
+    """Hash a file's contents, for files whose size or mtime changed."""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+
+def load_cache(cache_file: Path) -> dict[str, CacheEntry]:
+    """Load cached parse results, treating a missing or stale cache as empty."""
+    try:
+        with cache_file.open('rb') as f:
+            version, entries = pickle.load(f)
+    except Exception:
+        return {}
+    return entries if version == parser_version() else {}
+
+
+def save_cache(cache_file: Path, entries: dict[str, CacheEntry]) -> None:
+    """Write parse results for the next run; failures only cost a re-parse."""
+    tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_file.open('wb') as f:
+            pickle.dump((parser_version(), entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write cache {cache_file}: {e}", file=sys.stderr)
+
+
 def detect_frameworks(all_imports: set[str]) -> list[str]:
     """Detect frameworks from imports."""
+    # An import matches an indicator equal to it or to any prefix ending before
+    # a '/' or '-' (e.g. '@nestjs/core' gives '@nestjs', 'react-dom' gives 'react')
+    roots = set(all_imports)
+    for i in all_imports:
+        for sep in re.finditer(r'[/-]', i):
+            roots.add(i[:sep.start()])
+
     detected = []
     for imp, name in FRAMEWORK_INDICATORS.items():
-        for i in all_imports:
-            if i == imp or i.startswith(imp + '/') or i.startswith(imp + '-'):
-                if name not in detected:
-                    detected.append(name)
-                break
+        if imp in roots and name not in detected:
+            detected.append(name)
     return detected
 
 
@@ -421,34 +725,31 @@ def format_type(t: TypeInfo) -> str:
     return ' '.join(parts)
 
 
-def format_output(files: list[FileInfo], root: Path, frameworks: list[str]) -> str:
-    """Format the parsed files into markdown output."""
-    lines = []
-    lines.append("### TypeScript: " + str(root.name) + "/")
+def iter_output_lines(files: list[FileInfo], root: Path, frameworks: list[str]) -> Iterator[str]:
+    """Yield the markdown output for the parsed files, line by line."""
+    yield "### TypeScript: " + str(root.name) + "/"
 
     if frameworks:
-        lines.append(f"**Frameworks detected:** {', '.join(frameworks)}")
-        lines.append("")
+        yield f"**Frameworks detected:** {', '.join(frameworks)}"
+        yield ""
 
-    # Group by directory
-    dir_files: dict[str, list[FileInfo]] = defaultdict(list)
+    # Group by directory, keeping each file's name. Every path was found under
+    # root, so its relative path is what follows the root prefix.
+    prefix_len = len(os.path.join(str(root), ''))
+    dir_files: dict[str, list[tuple[str, FileInfo]]] = defaultdict(list)
     for f in files:
-        rel_path = Path(f.path).relative_to(root)
-        dir_name = str(rel_path.parent) if rel_path.parent != Path('.') else ''
-        dir_files[dir_name].append(f)
+        dir_name, filename = os.path.split(f.path[prefix_len:])
+        dir_files[dir_name].append((filename, f))
 
     for dir_name in sorted(dir_files.keys()):
         dir_file_list = dir_files[dir_name]
         if dir_name:
-            lines.append(f"- `{dir_name}/`")
+            yield f"- `{dir_name}/`"
             indent = "  "
         else:
             indent = ""
 
-        for f in sorted(dir_file_list, key=lambda x: x.path):
-            rel_path = Path(f.path).relative_to(root)
-            filename = rel_path.name
-
+        for filename, f in sorted(dir_file_list, key=lambda entry: entry[1].path):
             # Skip index files unless they have meaningful content
             if filename in ['index.ts', 'index.tsx', 'index.js'] and not f.types:
                 continue
@@ -457,11 +758,22 @@ def format_output(files: list[FileInfo], root: Path, frameworks: list[str]) -> s
             if not exported_types:
                 continue
 
-            lines.append(f"{indent}- `{filename}`:")
+            yield f"{indent}- `{filename}`:"
             for t in exported_types:
-                lines.append(f"{indent}  - {format_type(t)}")
+                yield f"{indent}  - {format_type(t)}"
+
+
+def format_output(files: list[FileInfo], root: Path, frameworks: list[str]) -> str:
+    """Format the parsed files into markdown output."""
+    return '\n'.join(iter_output_lines(files, root, frameworks))
+
 
-    return '\n'.join(lines)
+def write_output(out: TextIO, lines: Iterable[str]) -> None:
+    """Write output lines to a stream as they are produced, newline-separated."""
+    sep = ''
+    for line in lines:
+        out.write(sep + line)
+        sep = '\n'
 
 
 def main():
@@ -472,6 +784,12 @@ def main():
                         help='Output depth level')
     parser.add_argument('--exclude', type=str, default='',
                         help='Comma-separated directories to exclude')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Parallel parser processes (default: CPU count, 1 disables)')
+    parser.add_argument('--cache-dir', type=Path, default=CACHE_DIR,
+                        help=f'Where parse results are kept between runs (default: {CACHE_DIR})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse every file instead of reusing results from the last run')
     args = parser.parse_args()
 
     root = args.root.resolve()
@@ -482,6 +800,7 @@ def main():
     excludes = DEFAULT_EXCLUDES.copy()
     if args.exclude:
         excludes.update(args.exclude.split(','))
+    excludes = frozenset(excludes)
 
     # Collect all TypeScript/JavaScript files
     files: list[FileInfo] = []
@@ -489,35 +808,62 @@ def main():
     file_count = 0
     type_count = 0
 
-    for pattern in ['*.ts', '*.tsx', '*.js', '*.jsx']:
-        for ts_file in root.rglob(pattern):
-            # Skip declaration files
-            if ts_file.name.endswith('.d.ts'):
-                continue
-
-            rel_path = ts_file.relative_to(root)
-            if should_exclude(rel_path, excludes):
-                continue
-
-            file_info = parse_file(ts_file, args.depth)
-            if file_info:
-                files.append(file_info)
-                all_imports.update(file_info.imports)
-                file_count += 1
-                type_count += len(file_info.types)
+    ts_files = list(find_ts_files(str(root), excludes))
+
+    # Files are reused when their size and mtime match the last run, or failing
+    # that when their contents do (e.g. a checkout that only touched them)
+    cache_file = None if args.no_cache else cache_file_for(args.cache_dir, root, args.depth)
+    cached = load_cache(cache_file) if cache_file else {}
+    entries: dict[str, CacheEntry] = {}
+    stale = []
+    dirty = False
+    for ts_file in ts_files:
+        st = os.stat(ts_file)
+        entry = cached.get(ts_file)
+        if entry and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            entries[ts_file] = entry
+            continue
+        digest = content_digest(ts_file) if cache_file else b''
+        if entry and entry.digest == digest:
+            entries[ts_file] = entry._replace(mtime_ns=st.st_mtime_ns, size=st.st_size)
+            dirty = True
+        else:
+            stale.append((ts_file, st, digest))
+
+    parse = partial(parse_file, depth=args.depth)
+    stale_files = [ts_file for ts_file, _, _ in stale]
+    for (ts_file, st, digest), file_info in zip(stale, parse_files(parse, stale_files, args.jobs)):
+        if file_info:
+            entries[ts_file] = CacheEntry(st.st_mtime_ns, st.st_size, digest, file_info)
+            dirty = True
+
+    # Entries for deleted files are dropped by only saving the current ones
+    if cache_file and (dirty or len(entries) != len(cached)):
+        save_cache(cache_file, entries)
+
+    for ts_file in ts_files:
+        entry = entries.get(ts_file)
+        if entry:
+            file_info = entry.file_info
+            files.append(file_info)
+            all_imports.update(file_info.imports)
+            file_count += 1
+            type_count += len(file_info.types)
 
     frameworks = detect_frameworks(all_imports)
-    output = format_output(files, root, frameworks)
 
     # Add stats as comment
     stats = f"\n<!-- TypeScript: {file_count} files, {type_count} exports -->\n"
 
     if args.output:
-        args.output.write_text(output + stats, encoding='utf-8')
+        # Stream to the file rather than building the whole map in memory first
+        with args.output.open('w', encoding='utf-8', buffering=1024 * 1024) as out:
+            write_output(out, iter_output_lines(files, root, frameworks))
+            out.write(stats)
         print(f"Output written to {args.output}")
         print(f"Files: {file_count}, Exports: {type_count}")
     else:
-        print(output + stats)
+        print(format_output(files, root, frameworks) + stats)
 
 
 if __name__ == '__main__':
@@ -11,6 +11,8 @@ Usage:
 """
 
 import argparse
+import os
+import shutil
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -45,6 +47,19 @@ def read_maps(map_files: list[Path]) -> str:
     return header + "\n\n" + "\n\n".join(sections)
 
 
+def write_atomic(path: Path, content: str) -> None:
+    """Replace a file's content in one step, so an interrupted write can't truncate it."""
+    target = path.resolve()  # Keep symlinks pointing at the updated file
+    tmp_path = target.with_name(f'{target.name}.{os.getpid()}.tmp')
+    try:
+        tmp_path.write_text(content, encoding='utf-8')
+        shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def update_claude_md(claude_md_path: Path, map_content: str, insert_after: str) -> bool:
     """Update CLAUDE.md with map content using markers."""
 
@@ -61,14 +76,15 @@ def update_claude_md(claude_md_path: Path, map_content: str, insert_after: str)
     start_idx = content.find(START_MARKER)
     end_idx = content.find(END_MARKER)
 
+    # New content is joined in one go; chaining + copies the document per operator
     if start_idx != -1 and end_idx != -1:
         # Replace content between markers
-        new_content = (
-            content[:start_idx] +
-            START_MARKER + "\n" +
-            map_content + "\n" +
-            content[end_idx:]
-        )
+        new_content = ''.join((
+            content[:start_idx],
+            START_MARKER, "\n",
+            map_content, "\n",
+            content[end_idx:],
+        ))
         print(f"Updated existing map section in {claude_md_path}")
     else:
         # Insert after specified section
@@ -83,15 +99,15 @@ def update_claude_md(claude_md_path: Path, map_content: str, insert_after: str)
             if section_end == -1:
                 section_end = len(content)
 
-            new_content = (
-                content[:section_end].rstrip() +
-                marked_section +
-                content[section_end:]
-            )
+            new_content = ''.join((
+                content[:section_end].rstrip(),
+                marked_section,
+                content[section_end:],
+            ))
             print(f"Inserted map section after '{insert_after}' in {claude_md_path}")
 
     # Write updated content
-    claude_md_path.write_text(new_content, encoding='utf-8')
+    write_atomic(claude_md_path, new_content)
     return True
 
 
@@ -116,7 +132,7 @@ def remove_map_section(claude_md_path: Path) -> bool:
 
     new_content = before + "\n\n" + after
 
-    claude_md_path.write_text(new_content, encoding='utf-8')
+    write_atomic(claude_md_path, new_content)
     print(f"Removed map section from {claude_md_path}")
     return True
 